@@ -0,0 +1,87 @@
+# audio_chunking.py
+from typing import List, Tuple
+import numpy as np
+
+# Silence detection
+MIN_SILENCE_DURATION_S = 1.0  # Shortest pause we are willing to cut at
+SILENCE_SEEK_STEP_S = 0.1  # Resolution of silence detection, like pydub seek_step=100
+INT16_MAX_AMPLITUDE = 32768
+
+def compute_block_energies(samples: np.ndarray, block_size: int) -> np.ndarray:
+    """Sum of squared samples per block, converted in slices to bound memory"""
+    n_blocks = len(samples) // block_size
+    energies = np.empty(n_blocks, dtype=np.float64)
+    slice_blocks = 65536
+    for first in range(0, n_blocks, slice_blocks):
+        last = min(first + slice_blocks, n_blocks)
+        part = samples[first * block_size:last * block_size].astype(np.float64)
+        energies[first:last] = np.square(part).reshape(-1, block_size).sum(axis=1)
+    return energies
+
+def compute_dbfs(energies: np.ndarray, n_samples: int) -> float:
+    """Loudness of the whole signal in dBFS, from its block energies"""
+    rms = np.sqrt(energies.sum() / max(n_samples, 1))
+    if rms == 0:
+        return -float("inf")
+    return float(20 * np.log10(rms / INT16_MAX_AMPLITUDE))
+
+def detect_silences(energies: np.ndarray, block_size: int, sample_rate: int,
+                    threshold_db: float) -> List[Tuple[float, float]]:
+    """Find (start, end) seconds of silences with a vectorized rolling RMS.
+    
+    Same rule as pydub's detect_silence: a window of MIN_SILENCE_DURATION_S is
+    silent when its RMS is below threshold_db, and overlapping silent windows
+    merge into one silence.
+    """
+    window_blocks = int(MIN_SILENCE_DURATION_S / SILENCE_SEEK_STEP_S)
+    if len(energies) < window_blocks:
+        return []
+    
+    # Rolling RMS of every window, from a cumulative sum of block energies
+    cumulative = np.concatenate(([0.0], np.cumsum(energies)))
+    window_energy = cumulative[window_blocks:] - cumulative[:-window_blocks]
+    window_rms = np.sqrt(window_energy / (window_blocks * block_size))
+    threshold = 10 ** (threshold_db / 20) * INT16_MAX_AMPLITUDE
+    silent = window_rms < threshold
+    
+    # Runs of silent windows, as [first, last] window indices
+    edges = np.diff(silent.astype(np.int8), prepend=0, append=0)
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1) - 1
+    
+    block_s = block_size / sample_rate
+    return [
+        (start * block_s, (end + window_blocks) * block_s)
+        for start, end in zip(run_starts.tolist(), run_ends.tolist())
+    ]
+
+def plan_chunk_boundaries(silences: List[Tuple[float, float]], duration_s: float,
+                          max_chunk_s: float) -> List[float]:
+    """Pick cut points in the middle of silences so no chunk exceeds max_chunk_s.
+    
+    Each chunk is cut at the last silence that still fits under max_chunk_s,
+    which packs it as long as the pauses allow (fewer chunks, fewer
+    recognition requests). A chunk is hard-cut at max_chunk_s only when it
+    contains no silence at all.
+    """
+    cut_points = []
+    chunk_start = 0.0
+    last_candidate = None
+    
+    for silence_start, silence_end in silences:
+        candidate = (silence_start + silence_end) / 2
+        while candidate - chunk_start > max_chunk_s:
+            # Cut at the last silence that fits, or hard-cut if there was none
+            cut = last_candidate if last_candidate is not None else chunk_start + max_chunk_s
+            cut_points.append(cut)
+            chunk_start = cut
+            last_candidate = None
+        last_candidate = candidate
+    
+    while duration_s - chunk_start > max_chunk_s:
+        cut = last_candidate if last_candidate is not None else chunk_start + max_chunk_s
+        cut_points.append(cut)
+        chunk_start = cut
+        last_candidate = None
+    
+    return cut_points
@@ -0,0 +1,88 @@
+# auth_cache.py
+import hashlib
+import hmac
+import os
+import threading
+import time
+from typing import Optional
+from cachetools import TTLCache
+from sqlalchemy.orm import Session, make_transient_to_detached
+from config import settings
+from database import User
+
+# Short-lived cache of successful password verifications.
+# Argon2 is deliberately expensive, so repeat logins within a few seconds
+# skip the KDF. Entries expire quickly so password changes take effect fast.
+VERIFY_CACHE_MAXSIZE = 10_000
+VERIFY_CACHE_TTL_SECONDS = 5
+
+# Per-process pepper so cache keys never contain the plaintext password
+_process_pepper = os.urandom(32)
+
+# Verified JWTs, keyed by sha256(token) -> (user_id, exp)
+TOKEN_CACHE_MAXSIZE = 50_000
+
+# Resolved users, kept very briefly to skip the per-request SELECT
+USER_CACHE_MAXSIZE = 10_000
+USER_CACHE_TTL_SECONDS = 5
+
+_verify_cache = TTLCache(maxsize=VERIFY_CACHE_MAXSIZE, ttl=VERIFY_CACHE_TTL_SECONDS)
+_verify_lock = threading.Lock()
+
+_token_cache = TTLCache(maxsize=TOKEN_CACHE_MAXSIZE, ttl=settings.JWT_CACHE_TTL)
+_user_cache = TTLCache(maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL_SECONDS)
+_token_lock = threading.Lock()
+
+def _cache_key(user_id: str, password_hash: str, password: str) -> bytes:
+    """Build the cache key for a user/password pair"""
+    # The stored hash is part of the key so a changed password never hits
+    message = f"{user_id}:{password_hash}:{password}".encode()
+    return hmac.new(_process_pepper, message, "sha256").digest()
+
+def is_verified(user_id: str, password_hash: str, password: str) -> bool:
+    """Return True if this password was verified for the user recently"""
+    key = _cache_key(user_id, password_hash, password)
+    with _verify_lock:
+        return _verify_cache.get(key, False)
+
+def mark_verified(user_id: str, password_hash: str, password: str) -> None:
+    """Remember a successful verification. Failures must never be cached."""
+    key = _cache_key(user_id, password_hash, password)
+    with _verify_lock:
+        _verify_cache[key] = True
+
+def get_token_user_id(token: str) -> Optional[str]:
+    """Return the user id of a recently verified, still unexpired token"""
+    key = hashlib.sha256(token.encode()).digest()
+    with _token_lock:
+        entry = _token_cache.get(key)
+    if entry is None:
+        return None
+    user_id, exp = entry
+    if exp <= time.time():
+        return None
+    return user_id
+
+def cache_token(token: str, user_id: str, exp) -> None:
+    """Remember a successfully verified token until the cache TTL or its expiry"""
+    if exp is None or exp <= time.time():
+        return
+    key = hashlib.sha256(token.encode()).digest()
+    with _token_lock:
+        _token_cache[key] = (user_id, exp)
+
+def get_cached_user(db: Session, user_id: str) -> Optional[User]:
+    """Rebuild a recently loaded user and attach it to the session without SQL"""
+    with _token_lock:
+        snapshot = _user_cache.get(user_id)
+    if snapshot is None:
+        return None
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+def cache_user(user: User) -> None:
+    """Remember the column values of a loaded user"""
+    snapshot = {column.key: getattr(user, column.key) for column in User.__table__.columns}
+    with _token_lock:
+        _user_cache[str(user.id)] = snapshot
@@ -6,17 +6,32 @@ class Settings:
     
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "postgresql://localhost:5432/meeting_transcription")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "30"))
     
     # JWT
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-this-in-production")
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
+    JWT_CACHE_TTL: int = int(os.getenv("JWT_CACHE_TTL", "60"))  # seconds a verified token is reused
+    
+    # Argon2 password hashing (OWASP 46 MiB profile, ~50 ms per hash)
+    ARGON2_TIME_COST: int = int(os.getenv("ARGON2_T", "3"))
+    ARGON2_MEMORY_COST_KIB: int = int(os.getenv("ARGON2_M_KIB", "47104"))
+    ARGON2_PARALLELISM: int = int(os.getenv("ARGON2_P", "1"))  # match the container's vCPUs
     
     # Google Cloud
     GOOGLE_CLOUD_PROJECT: Optional[str] = os.getenv("GOOGLE_CLOUD_PROJECT", "echonote-461723")
     GOOGLE_CLOUD_LOCATION: str = os.getenv("GOOGLE_CLOUD_LOCATION", "europe-west4")
     GCS_BUCKET_NAME: str = os.getenv("GCS_BUCKET_NAME", "echonote-461723-audio")
     
+    # Job queue (arq)
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    # Each job keeps the source file, its 16 kHz PCM (~115 MB/hour) and chunks
+    # not yet uploaded (up to ~60 MB/hour) on local disk, which is RAM on
+    # Cloud Run: budget about source size + 175 MB per audio hour per job
+    WORKER_MAX_JOBS: int = int(os.getenv("WORKER_MAX_JOBS", "4"))
+    
     # Application
     PORT: int = int(os.getenv("PORT", "8000"))
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
@@ -1,15 +1,12 @@
-import os
 import uuid
-from datetime import datetime, date
-from sqlalchemy import create_engine, Column, String, Integer, Text, DateTime, Date, ForeignKey, CheckConstraint, Boolean
+from datetime import date
+from sqlalchemy import create_engine, select, update, func, Column, String, Integer, Text, DateTime, Date, ForeignKey, CheckConstraint, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship, Session
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, insert as pg_insert
+from config import settings
 import logging
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, 
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 Base = declarative_base()
@@ -21,7 +18,7 @@ class User(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String, unique=True, nullable=False)
     password_hash = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now())
     
     # Relationship to transcripts
     transcripts = relationship("Transcript", back_populates="user", cascade="all, delete-orphan")
@@ -40,8 +37,8 @@ class Transcript(Base):
     speaker_count = Column(Integer)
     transcript_text = Column(Text)
     summary_text = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    completed_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), default=func.now(), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True))
     
     # Relationship to user
     user = relationship("User", back_populates="transcripts")
@@ -51,14 +48,28 @@ class Usage(Base):
     
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
     period_start = Column(Date, primary_key=True)
-    seconds_transcribed = Column(Integer, default=0)
+    seconds_transcribed = Column(Integer, default=0, server_default="0")
     
     # Relationship to user
     user = relationship("User", back_populates="usage")
 
+# Indexes for the per-user dashboard and lookup queries
+Index("ix_transcripts_user_id_created_at", Transcript.user_id, Transcript.created_at.desc())
+Index("ix_transcripts_user_id_id", Transcript.user_id, Transcript.id)
+Index("ix_usage_user_period", Usage.user_id, Usage.period_start,
+      postgresql_include=["seconds_transcribed"])
+
 # Database connection
-DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://localhost:5432/meeting_transcription")
-engine = create_engine(DATABASE_URL, echo=True)
+DATABASE_URL = settings.DATABASE_URL
+engine = create_engine(
+    DATABASE_URL,
+    echo=settings.DEBUG,  # Statement logging is expensive, keep it for debugging only
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_use_lifo=True,  # Reuse the most recent connection so idle ones can be recycled
+    pool_recycle=1800
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create tables
@@ -76,6 +87,8 @@ def get_db():
         db.close()
 
 # Helper functions
+_TRANSCRIPT_COLUMNS = frozenset(column.key for column in Transcript.__table__.columns)
+
 def get_user_by_email(db: Session, email: str):
     """Get user by email"""
     return db.query(User).filter(User.email == email).first()
@@ -88,6 +101,13 @@ def create_user(db: Session, email: str, password_hash: str):
     db.refresh(user)
     return user
 
+def update_user_password_hash(db: Session, user: User, password_hash: str):
+    """Replace a user's stored password hash"""
+    user.password_hash = password_hash
+    db.commit()
+    db.refresh(user)
+    return user
+
 def get_transcript_by_id(db: Session, transcript_id: str, user_id: str):
     """Get transcript by ID for a specific user"""
     return db.query(Transcript).filter(
@@ -96,8 +116,22 @@ def get_transcript_by_id(db: Session, transcript_id: str, user_id: str):
     ).first()
 
 def get_user_transcripts(db: Session, user_id: str):
-    """Get all transcripts for a user"""
-    return db.query(Transcript).filter(Transcript.user_id == user_id).all()
+    """Get list columns of all transcripts for a user, newest first"""
+    # Only the list columns are selected, the text columns can be very large
+    return db.execute(
+        select(
+            Transcript.id,
+            Transcript.original_filename,
+            Transcript.language,
+            Transcript.status,
+            Transcript.duration_seconds,
+            Transcript.speaker_count,
+            Transcript.created_at,
+            Transcript.completed_at
+        )
+        .where(Transcript.user_id == user_id)
+        .order_by(Transcript.created_at.desc())
+    ).all()
 
 def create_transcript(db: Session, user_id: str, language: str, original_filename: str, gcs_uri: str):
     """Create a new transcript record"""
@@ -114,18 +148,19 @@ def create_transcript(db: Session, user_id: str, language: str, original_filenam
     return transcript
 
 def update_transcript_status(db: Session, transcript_id: str, status: str, **kwargs):
-    """Update transcript status and other fields"""
-    transcript = db.query(Transcript).filter(Transcript.id == transcript_id).first()
-    if transcript:
-        transcript.status = status
-        for key, value in kwargs.items():
-            if hasattr(transcript, key):
-                setattr(transcript, key, value)
-        if status == 'done':
-            transcript.completed_at = datetime.utcnow()
-        db.commit()
-        db.refresh(transcript)
-    return transcript
+    """Update transcript status and other fields in a single UPDATE statement"""
+    values = {"status": status}
+    values.update({key: value for key, value in kwargs.items() if key in _TRANSCRIPT_COLUMNS})
+    if status == 'done':
+        values["completed_at"] = func.now()
+    
+    db.execute(
+        update(Transcript)
+        .where(Transcript.id == uuid.UUID(str(transcript_id)))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
 
 def update_usage(db: Session, user_id: str, seconds_transcribed: int):
     """Update or create usage record for the current period"""
@@ -133,21 +168,17 @@ def update_usage(db: Session, user_id: str, seconds_transcribed: int):
     # Get first day of current month
     period_start = today.replace(day=1)
     
-    usage = db.query(Usage).filter(
-        Usage.user_id == user_id,
-        Usage.period_start == period_start
-    ).first()
-    
-    if usage:
-        usage.seconds_transcribed += seconds_transcribed
-    else:
-        usage = Usage(
-            user_id=user_id,
-            period_start=period_start,
-            seconds_transcribed=seconds_transcribed
-        )
-        db.add(usage)
+    # Single atomic upsert, concurrent completions can't lose an update
+    stmt = pg_insert(Usage).values(
+        user_id=user_id,
+        period_start=period_start,
+        seconds_transcribed=seconds_transcribed
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Usage.user_id, Usage.period_start],
+        set_={"seconds_transcribed": Usage.seconds_transcribed + stmt.excluded.seconds_transcribed}
+    ).returning(Usage)
     
+    usage = db.scalars(stmt, execution_options={"populate_existing": True}).one()
     db.commit()
-    db.refresh(usage)
     return usage
@@ -64,6 +64,32 @@ resource "google_service_networking_connection" "private_vpc_connection" {
   reserved_peering_ranges = [google_compute_global_address.private_ip_address.name]
 }
 
+# Memorystore Redis for the arq job queue, reached over the VPC
+resource "google_redis_instance" "queue" {
+  name               = "echonote-queue"
+  tier               = "BASIC"
+  memory_size_gb     = 1
+  region             = var.region
+  redis_version      = "REDIS_7_0"
+  authorized_network = google_compute_network.vpc.id
+  connect_mode       = "PRIVATE_SERVICE_ACCESS"
+
+  depends_on = [google_service_networking_connection.private_vpc_connection]
+}
+
+# Redis URL secret, read by the API and the worker
+resource "google_secret_manager_secret" "redis_url" {
+  secret_id = "redis-url"
+  replication {
+    automatic = true
+  }
+}
+
+resource "google_secret_manager_secret_version" "redis_url_value" {
+  secret      = google_secret_manager_secret.redis_url.id
+  secret_data = "redis://${google_redis_instance.queue.host}:${google_redis_instance.queue.port}/0"
+}
+
 # JWT Secret in Secret Manager
 resource "google_secret_manager_secret" "jwt" {
   secret_id = "jwt-secret"
@@ -151,6 +177,12 @@ resource "google_secret_manager_secret_iam_member" "jwt_secret_access" {
   member    = "serviceAccount:${google_service_account.transcripts_api.email}"
 }
 
+resource "google_secret_manager_secret_iam_member" "redis_url_access" {
+  secret_id = google_secret_manager_secret.redis_url.secret_id
+  role      = "roles/secretmanager.secretAccessor"
+  member    = "serviceAccount:${google_service_account.transcripts_api.email}"
+}
+
 resource "google_secret_manager_secret_iam_member" "db_password_access" {
   secret_id = google_secret_manager_secret.db_password.secret_id
   role      = "roles/secretmanager.secretAccessor"
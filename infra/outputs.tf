@@ -17,4 +17,9 @@ output "database_url" {
   description = "Database connection URL for Cloud Run"
   value       = "postgresql+asyncpg://appuser:PASSWORD_FROM_SECRET@/transcripts?host=/cloudsql/${google_sql_database_instance.pg.connection_name}"
   sensitive   = true
-} 
\ No newline at end of file
+} 
+
+output "redis_host" {
+  description = "Memorystore Redis host for the job queue"
+  value       = google_redis_instance.queue.host
+}
@@ -1,8 +1,11 @@
 # main.py
-from fastapi import FastAPI, File, UploadFile, Depends, HTTPException, status, Form, BackgroundTasks
+from fastapi import FastAPI, File, UploadFile, Depends, HTTPException, status, Form, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from arq import create_pool
+from arq.connections import RedisSettings
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import List, Optional
 import uuid
 import logging
@@ -10,14 +13,13 @@ import os
 from datetime import datetime
 
 # Local imports
+from config import settings
 from database import (
-    get_db, create_tables, User, Transcript,
-    get_user_transcripts, get_transcript_by_id,
-    create_transcript, update_transcript_status, update_usage
+    get_db, create_tables, User,
+    get_user_transcripts, get_transcript_by_id, create_transcript
 )
-from auth import auth_router, get_current_user
-from transcriber import transcribe_audio_file
-from summarizer import generate_summary_and_action_items
+from auth import auth_router, get_current_user, warm_up_password_hasher
+from transcriber import upload_audio_to_gcs
 
 # Setup logging
 logging.basicConfig(level=logging.INFO,
@@ -42,7 +44,9 @@ app.add_middleware(
 
 # Pydantic models for responses
 class TranscriptListItem(BaseModel):
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: uuid.UUID
     original_filename: str
     language: str
     status: str
@@ -52,7 +56,9 @@ class TranscriptListItem(BaseModel):
     completed_at: Optional[datetime]
 
 class TranscriptDetail(BaseModel):
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: uuid.UUID
     original_filename: str
     language: str
     status: str
@@ -63,21 +69,31 @@ class TranscriptDetail(BaseModel):
     created_at: datetime
     completed_at: Optional[datetime]
 
+# Validates and serializes whole lists in pydantic-core
+_TRANSCRIPT_LIST_ADAPTER = TypeAdapter(List[TranscriptListItem])
+
 class AudioUploadResponse(BaseModel):
     job_id: str
     message: str
 
-# Create database tables on startup
+# Create database tables and connect to the job queue on startup
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database tables"""
+    """Initialize database tables and the job queue connection"""
     try:
         create_tables()
+        warm_up_password_hasher()  # Per worker process, Argon2 memory isn't shared
+        app.state.arq_pool = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
         logger.info("Application started successfully")
     except Exception as e:
         logger.error(f"Startup failed: {str(e)}")
         raise
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the job queue connection"""
+    await app.state.arq_pool.close()
+
 # Health check endpoint
 @app.get("/", tags=["health"])
 async def health_check():
@@ -88,64 +104,20 @@ async def health_check():
         "timestamp": datetime.utcnow().isoformat()
     }
 
-# Background task for processing audio
-async def process_audio_background(
-    transcript_id: str,
-    audio_file_content: bytes,
-    original_filename: str,
-    language: str,
-    db_session: Session
-):
-    """Background task to process audio transcription"""
-    try:
-        logger.info(f"Starting background processing for transcript {transcript_id}")
-        
-        # Update status to processing
-        update_transcript_status(db_session, transcript_id, "processing")
-        
-        # Create a temporary file-like object from bytes
-        import io
-        audio_file = io.BytesIO(audio_file_content)
-        
-        # Transcribe audio
-        result = await transcribe_audio_file(audio_file, language, original_filename)
-        
-        # Generate summary
-        summary_result = await generate_summary_and_action_items(
-            result["transcript_text"], language
-        )
-        
-        # Update transcript with results
-        update_transcript_status(
-            db_session,
-            transcript_id,
-            "done",
-            transcript_text=result["transcript_text"],
-            summary_text=summary_result["summary_text"],
-            duration_seconds=result["duration_seconds"],
-            speaker_count=result["speaker_count"],
-            gcs_uri=result["gcs_uri"]
-        )
-        
-        # Update usage statistics
-        transcript = db_session.query(Transcript).filter(Transcript.id == transcript_id).first()
-        if transcript:
-            update_usage(db_session, str(transcript.user_id), result["duration_seconds"])
-        
-        logger.info(f"Successfully processed transcript {transcript_id}")
-        
-    except Exception as e:
-        logger.error(f"Background processing failed for transcript {transcript_id}: {str(e)}")
-        # Update status to error
-        update_transcript_status(db_session, transcript_id, "error")
-
 # Include auth router
 app.include_router(auth_router)
 
+# Upload validation
+_ALLOWED_LANGUAGES = frozenset({"it", "en"})
+_ALLOWED_CONTENT_TYPES = frozenset({"audio/mpeg", "audio/mp4", "audio/wav", "audio/flac", "audio/m4a"})
+_UNSUPPORTED_TYPE_DETAIL = (
+    "Unsupported file type. Allowed types: "
+    "audio/mpeg, audio/mp4, audio/wav, audio/flac, audio/m4a"
+)
+
 # Audio upload endpoint
 @app.post("/audio", response_model=AudioUploadResponse, tags=["transcription"])
 async def upload_audio(
-    background_tasks: BackgroundTasks,
     audio: UploadFile = File(...),
     language: str = Form(...),
     current_user: User = Depends(get_current_user),
@@ -154,23 +126,25 @@ async def upload_audio(
     """Upload audio file for transcription"""
     
     # Validate language
-    if language not in ["it", "en"]:
+    if language not in _ALLOWED_LANGUAGES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Language must be 'it' or 'en'"
         )
     
     # Validate file type
-    allowed_types = ["audio/mpeg", "audio/mp4", "audio/wav", "audio/flac", "audio/m4a"]
-    if audio.content_type not in allowed_types:
+    if audio.content_type not in _ALLOWED_CONTENT_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported file type. Allowed types: {', '.join(allowed_types)}"
+            detail=_UNSUPPORTED_TYPE_DETAIL
         )
     
     try:
-        # Read audio file content
-        audio_content = await audio.read()
+        # Store the upload in GCS so any worker can pick it up
+        # (streamed in chunks off the event loop, never fully read into memory)
+        gcs_uri = await run_in_threadpool(
+            upload_audio_to_gcs, audio.file, audio.filename, audio.content_type
+        )
         
         # Create transcript record
         transcript = create_transcript(
@@ -178,17 +152,17 @@ async def upload_audio(
             str(current_user.id),
             language,
             audio.filename,
-            ""  # GCS URI will be updated during processing
+            gcs_uri
         )
         
-        # Start background processing
-        background_tasks.add_task(
-            process_audio_background,
+        # Hand processing off to the worker queue
+        await app.state.arq_pool.enqueue_job(
+            "process_audio",
             str(transcript.id),
-            audio_content,
+            str(current_user.id),
+            gcs_uri,
             audio.filename,
-            language,
-            db
+            language
         )
         
         logger.info(f"Audio upload initiated for user {current_user.id}, transcript {transcript.id}")
@@ -206,29 +180,21 @@ async def upload_audio(
         )
 
 # Get user's transcripts
-@app.get("/transcripts", response_model=List[TranscriptListItem], tags=["transcription"])
+# Responses are serialized directly, response_model=None skips FastAPI's second pass
+@app.get("/transcripts", response_model=None, tags=["transcription"],
+         responses={200: {"model": List[TranscriptListItem]}})
 async def get_transcripts(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get all transcripts for the current user"""
     try:
-        transcripts = get_user_transcripts(db, str(current_user.id))
-        
-        result = []
-        for transcript in transcripts:
-            result.append(TranscriptListItem(
-                id=str(transcript.id),
-                original_filename=transcript.original_filename,
-                language=transcript.language,
-                status=transcript.status,
-                duration_seconds=transcript.duration_seconds,
-                speaker_count=transcript.speaker_count,
-                created_at=transcript.created_at,
-                completed_at=transcript.completed_at
-            ))
-        
-        return result
+        rows = get_user_transcripts(db, str(current_user.id))
+        items = _TRANSCRIPT_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+        return Response(
+            content=_TRANSCRIPT_LIST_ADAPTER.dump_json(items),
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"Failed to retrieve transcripts: {str(e)}")
@@ -238,9 +204,11 @@ async def get_transcripts(
         )
 
 # Get specific transcript
-@app.get("/transcripts/{transcript_id}", response_model=TranscriptDetail, tags=["transcription"])
+@app.get("/transcripts/{transcript_id}", response_model=None, tags=["transcription"],
+         responses={200: {"model": TranscriptDetail}})
 async def get_transcript(
     transcript_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -254,17 +222,20 @@ async def get_transcript(
                 detail="Transcript not found"
             )
         
-        return TranscriptDetail(
-            id=str(transcript.id),
-            original_filename=transcript.original_filename,
-            language=transcript.language,
-            status=transcript.status,
-            duration_seconds=transcript.duration_seconds,
-            speaker_count=transcript.speaker_count,
-            transcript_text=transcript.transcript_text,
-            summary_text=transcript.summary_text,
-            created_at=transcript.created_at,
-            completed_at=transcript.completed_at
+        # Completed transcripts never change, let clients revalidate cheaply
+        headers = {}
+        if transcript.status == "done" and transcript.completed_at is not None:
+            etag = f'W/"{int(transcript.completed_at.timestamp())}"'
+            headers = {"ETag": etag, "Cache-Control": "private, max-age=3600, immutable"}
+            if_none_match = request.headers.get("if-none-match", "")
+            if etag in (tag.strip() for tag in if_none_match.split(",")):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+        detail = TranscriptDetail.model_validate(transcript)
+        return Response(
+            content=detail.model_dump_json(),
+            media_type="application/json",
+            headers=headers
         )
         
     except HTTPException:
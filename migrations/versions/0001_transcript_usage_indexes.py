@@ -0,0 +1,48 @@
+"""Add indexes for per-user transcript and usage lookups
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # CONCURRENTLY can't run inside a transaction, and avoids locking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_transcripts_user_id_created_at",
+            "transcripts",
+            ["user_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            "ix_transcripts_user_id_id",
+            "transcripts",
+            ["user_id", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+        op.create_index(
+            "ix_usage_user_period",
+            "usage",
+            ["user_id", "period_start"],
+            postgresql_include=["seconds_transcribed"],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_usage_user_period", table_name="usage",
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_transcripts_user_id_id", table_name="transcripts",
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_transcripts_user_id_created_at", table_name="transcripts",
+                      postgresql_concurrently=True, if_exists=True)
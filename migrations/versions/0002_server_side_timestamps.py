@@ -0,0 +1,38 @@
+"""Use timezone-aware, database-generated timestamps
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Existing values were written with datetime.utcnow(), so they are UTC
+    for table, column in (("users", "created_at"), ("transcripts", "created_at"),
+                          ("transcripts", "completed_at")):
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+        )
+    op.alter_column("users", "created_at", server_default=sa.func.now())
+    op.alter_column("transcripts", "created_at", server_default=sa.func.now())
+    op.alter_column("usage", "seconds_transcribed", server_default="0")
+
+def downgrade():
+    op.alter_column("usage", "seconds_transcribed", server_default=None)
+    op.alter_column("transcripts", "created_at", server_default=None)
+    op.alter_column("users", "created_at", server_default=None)
+    for table, column in (("users", "created_at"), ("transcripts", "created_at"),
+                          ("transcripts", "completed_at")):
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+        )
@@ -1,26 +1,17 @@
 import os
 import logging
+import functools
 from google.cloud import aiplatform
-from google.cloud.aiplatform import gapic as aip
 from typing import Dict, Any
 
 logger = logging.getLogger(__name__)
 
-# Initialize AI Platform
+# AI Platform configuration
 PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT")
 LOCATION = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
 
-aiplatform.init(project=PROJECT_ID, location=LOCATION)
-
-async def generate_summary_and_action_items(transcript_text: str, language: str) -> Dict[str, Any]:
-    """Generate summary and action items from transcript text using Gemini"""
-    try:
-        # Choose model based on requirements
-        model_name = "gemini-pro"
-        
-        # Create appropriate prompt based on language
-        if language == "it":
-            prompt = f"""
+# Summary prompts, the transcript is substituted for {}
+_PROMPT_IT = """
 Analizza questa trascrizione di una riunione e fornisci:
 
 1. **Riassunto**: Un riassunto conciso dei punti principali discussi (2-3 paragrafi massimo)
@@ -28,12 +19,12 @@ Analizza questa trascrizione di una riunione e fornisci:
 3. **Azioni da intraprendere**: Una lista delle azioni concrete da completare, con eventuali responsabili se menzionati
 
 Trascrizione:
-{transcript_text}
+{}
 
 Rispondi in italiano e usa un formato strutturato.
 """
-        else:  # English
-            prompt = f"""
+
+_PROMPT_EN = """
 Analyze this meeting transcription and provide:
 
 1. **Summary**: A concise summary of the main points discussed (2-3 paragraphs maximum)
@@ -41,22 +32,28 @@ Analyze this meeting transcription and provide:
 3. **Action Items**: A list of concrete actions to be completed, with responsible parties if mentioned
 
 Transcription:
-{transcript_text}
+{}
 
 Please respond in English and use a structured format.
 """
+
+@functools.lru_cache(maxsize=1)
+def init_vertex_ai() -> bool:
+    """Initialize AI Platform once per process, returns False if no project is configured"""
+    if not PROJECT_ID:
+        return False
+    aiplatform.init(project=PROJECT_ID, location=LOCATION)
+    return True
+
+async def generate_summary_and_action_items(transcript_text: str, language: str) -> Dict[str, Any]:
+    """Generate summary and action items from transcript text using Gemini"""
+    try:
+        # The prompt (_PROMPT_IT / _PROMPT_EN) is only formatted with the
+        # transcript once a model call consumes it, to avoid the large copy
         
-        # Initialize Vertex AI client
-        client = aip.PredictionServiceClient(
-            client_options={"api_endpoint": f"{LOCATION}-aiplatform.googleapis.com"}
-        )
-        
-        # Prepare the request
-        endpoint = client.endpoint_path(
-            project=PROJECT_ID,
-            location=LOCATION,
-            endpoint="gemini-pro"
-        )
+        # Initialize Vertex AI (runs once). Keep any future model client at
+        # module level so its channel is reused across calls.
+        init_vertex_ai()
         
         # For now, let's use a simpler approach with basic text processing
         # In production, you would integrate with the actual Gemini API
@@ -75,16 +72,14 @@ Please respond in English and use a structured format.
 async def generate_basic_summary(transcript_text: str, language: str) -> str:
     """Generate a basic summary when AI service is not available"""
     try:
-        # Split transcript into sentences
-        sentences = transcript_text.split('. ')
-        
-        # Take first few sentences and last few sentences
-        if len(sentences) <= 5:
-            summary_sentences = sentences
+        # Take first few sentences and last few sentences. Only the head and
+        # tail are split off so long transcripts aren't split in full.
+        head = transcript_text.split('. ', 5)
+        if len(head) <= 5:
+            summary = transcript_text
         else:
-            summary_sentences = sentences[:3] + sentences[-2:]
-        
-        summary = '. '.join(summary_sentences)
+            tail = transcript_text.rsplit('. ', 2)
+            summary = '. '.join(head[:3] + tail[-2:])
         
         if language == "it":
             prefix = "Riassunto automatico della riunione:\n\n"
@@ -0,0 +1,59 @@
+import unittest
+import numpy as np
+
+from audio_chunking import (
+    SILENCE_SEEK_STEP_S, compute_block_energies, compute_dbfs,
+    detect_silences, plan_chunk_boundaries
+)
+
+SAMPLE_RATE_HZ = 16000
+
+class PlanChunkBoundariesTest(unittest.TestCase):
+    def test_short_audio_is_not_cut(self):
+        self.assertEqual(plan_chunk_boundaries([(100, 102)], 250, 300), [])
+    
+    def test_cuts_at_last_silence_under_cap(self):
+        silences = [(120, 122), (270, 272), (420, 422), (588, 590)]
+        self.assertEqual(plan_chunk_boundaries(silences, 720, 300), [271.0, 421.0])
+    
+    def test_cuts_at_early_silence_rather_than_mid_speech(self):
+        # The only pause in the first chunk is 30 s in
+        self.assertEqual(plan_chunk_boundaries([(29, 31)], 320, 300), [30.0])
+    
+    def test_hard_cut_without_silence(self):
+        self.assertEqual(plan_chunk_boundaries([], 700, 300), [300.0, 600.0])
+    
+    def test_chunks_never_exceed_cap(self):
+        silences = [(s, s + 1.5) for s in range(50, 3600, 137)]
+        cuts = plan_chunk_boundaries(silences, 3600, 300)
+        bounds = [0.0] + cuts + [3600.0]
+        self.assertTrue(all(0 < end - start <= 300 for start, end in zip(bounds, bounds[1:])))
+
+class DetectSilencesTest(unittest.TestCase):
+    def detect(self, samples):
+        block_size = int(SAMPLE_RATE_HZ * SILENCE_SEEK_STEP_S)
+        energies = compute_block_energies(samples, block_size)
+        dbfs = compute_dbfs(energies, len(energies) * block_size)
+        return detect_silences(energies, block_size, SAMPLE_RATE_HZ, dbfs - 14)
+    
+    def test_finds_pause_in_speech(self):
+        rng = np.random.default_rng(0)
+        samples = rng.integers(-8000, 8000, 20 * SAMPLE_RATE_HZ).astype(np.int16)
+        samples[10 * SAMPLE_RATE_HZ:12 * SAMPLE_RATE_HZ] = 0
+        silences = self.detect(samples)
+        self.assertEqual(len(silences), 1)
+        start, end = silences[0]
+        self.assertAlmostEqual(start, 10.0)
+        self.assertAlmostEqual(end, 12.0)
+    
+    def test_ignores_pause_shorter_than_minimum(self):
+        rng = np.random.default_rng(0)
+        samples = rng.integers(-8000, 8000, 20 * SAMPLE_RATE_HZ).astype(np.int16)
+        samples[10 * SAMPLE_RATE_HZ:int(10.5 * SAMPLE_RATE_HZ)] = 0
+        self.assertEqual(self.detect(samples), [])
+    
+    def test_audio_shorter_than_window(self):
+        self.assertEqual(self.detect(np.zeros(SAMPLE_RATE_HZ // 2, dtype=np.int16)), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,34 +1,95 @@
 import os
+import asyncio
+import functools
+import shutil
 import tempfile
 import logging
-from google.cloud import speech_v1 as speech
+from google.api_core.client_options import ClientOptions
+from google.api_core.exceptions import AlreadyExists, NotFound
 from google.cloud import storage
-from pydub import AudioSegment
-from pydub.silence import split_on_silence
-import io
-from typing import List, Dict, Any
+from google.cloud.storage import transfer_manager
+from google.cloud.speech_v2 import SpeechClient
+from google.cloud.speech_v2.types import cloud_speech
+import numpy as np
+import subprocess
+from typing import Callable, List, Dict, Any, Optional, Tuple
 import uuid
 
-logger = logging.getLogger(__name__)
+# Local imports
+from config import settings
+from audio_chunking import (
+    SILENCE_SEEK_STEP_S, compute_block_energies, compute_dbfs,
+    detect_silences, plan_chunk_boundaries
+)
 
-# Initialize Google Cloud clients
-speech_client = speech.SpeechClient()
-storage_client = storage.Client()
+logger = logging.getLogger(__name__)
 
 # Configuration
+GOOGLE_CLOUD_PROJECT = settings.GOOGLE_CLOUD_PROJECT
+# Speech runs next to the audio bucket unless told otherwise
+SPEECH_LOCATION = os.getenv("SPEECH_LOCATION", settings.GOOGLE_CLOUD_LOCATION)
+SPEECH_RECOGNIZER_ID = os.getenv("SPEECH_RECOGNIZER_ID", "echonote")
 GCS_BUCKET_NAME = os.getenv("GCS_BUCKET_NAME", "meeting-transcription-audio")
 MAX_CHUNK_DURATION_MS = 5 * 60 * 1000  # 5 minutes in milliseconds
+GCS_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB, must be a multiple of 256 KiB
+PARALLEL_UPLOAD_THRESHOLD = 64 * 1024 * 1024  # Above this, upload parts concurrently
+PARALLEL_UPLOAD_WORKERS = 8
+MAX_CONCURRENT_CHUNK_UPLOADS = 8
+PIPELINE_QUEUE_SIZE = 4  # Encoded chunks handed to uploaders ahead of time
+MAX_FILES_PER_BATCH = 15  # Speech v2 batch_recognize limit on files per request
+LANGUAGE_CODES = {"it": "it-IT", "en": "en-US"}
+SAMPLE_RATE_HZ = 16000
+
+# Chunk format sent to Speech: "flac" saves upload bandwidth, "linear16"
+# sends the raw PCM and skips encoding altogether
+CHUNK_ENCODING = os.getenv("CHUNK_ENCODING", "flac").lower()
+CHUNK_FORMATS = {
+    # encoding: (file extension, ffmpeg output options, content type)
+    "flac": ("flac", ["-c:a", "flac", "-compression_level", "0"], "audio/flac"),
+    "linear16": ("raw", ["-c:a", "copy", "-segment_format", "s16le"], "application/octet-stream"),
+}
+if CHUNK_ENCODING not in CHUNK_FORMATS:
+    raise ValueError(
+        f"Invalid CHUNK_ENCODING {CHUNK_ENCODING!r}, expected one of: {', '.join(CHUNK_FORMATS)}"
+    )
+CHUNK_EXTENSION, CHUNK_CODEC_OPTIONS, CHUNK_CONTENT_TYPE = CHUNK_FORMATS[CHUNK_ENCODING]
+
+# Initialize Google Cloud clients
+speech_client = SpeechClient(
+    client_options=ClientOptions(api_endpoint=f"{SPEECH_LOCATION}-speech.googleapis.com")
+    if SPEECH_LOCATION != "global" else None
+)
+storage_client = storage.Client()
 
-def upload_audio_to_gcs(audio_file, filename: str) -> str:
+def upload_audio_to_gcs(audio_file, filename: str, content_type: str = "audio/mpeg") -> str:
     """Upload audio file to Google Cloud Storage"""
     try:
         bucket = storage_client.bucket(GCS_BUCKET_NAME)
         blob_name = f"audio/{uuid.uuid4()}/{filename}"
         blob = bucket.blob(blob_name)
         
-        # Reset file pointer and upload
+        audio_file.seek(0, os.SEEK_END)
+        size = audio_file.tell()
         audio_file.seek(0)
-        blob.upload_from_file(audio_file, content_type="audio/mpeg")
+        
+        if size >= PARALLEL_UPLOAD_THRESHOLD:
+            # Large files: upload parts concurrently (XML multipart upload)
+            # to use the full outbound bandwidth. It needs a file name, so the
+            # spooled upload's descriptor is reopened by path instead of being
+            # copied to a second temp file (/tmp is in memory on Cloud Run).
+            # Parts are read from this process's threads, so the path stays valid.
+            transfer_manager.upload_chunks_concurrently(
+                f"/proc/self/fd/{audio_file.fileno()}",
+                blob,
+                content_type=content_type,
+                chunk_size=GCS_UPLOAD_CHUNK_SIZE,
+                worker_type=transfer_manager.THREAD,
+                max_workers=PARALLEL_UPLOAD_WORKERS
+            )
+        else:
+            # Stream it through a resumable upload, so at most one chunk is buffered
+            with blob.open("wb", chunk_size=GCS_UPLOAD_CHUNK_SIZE, content_type=content_type) as writer:
+                shutil.copyfileobj(audio_file, writer, length=1 << 20)
         
         gcs_uri = f"gs://{GCS_BUCKET_NAME}/{blob_name}"
         logger.info(f"Audio uploaded to GCS: {gcs_uri}")
@@ -38,170 +99,376 @@ def upload_audio_to_gcs(audio_file, filename: str) -> str:
         logger.error(f"Failed to upload audio to GCS: {str(e)}")
         raise
 
-def convert_and_split_audio(audio_file) -> List[bytes]:
-    """Convert audio to FLAC and split into chunks"""
+def download_audio_from_gcs(gcs_uri: str, destination_path: str) -> None:
+    """Download an uploaded audio file from Google Cloud Storage to a local path"""
     try:
-        # Load audio file
-        audio_file.seek(0)
-        audio = AudioSegment.from_file(audio_file)
+        blob = storage.Blob.from_string(gcs_uri, client=storage_client)
+        blob.download_to_filename(destination_path)
+        logger.info(f"Audio downloaded from GCS: {gcs_uri}")
+        
+    except Exception as e:
+        logger.error(f"Failed to download audio from GCS: {str(e)}")
+        raise
+
+def upload_chunk_to_gcs(chunk_path: str, session_id: str, index: int) -> str:
+    """Upload one chunk file to Google Cloud Storage and return its URI"""
+    try:
+        bucket = storage_client.bucket(GCS_BUCKET_NAME)
+        blob_name = f"audio/{session_id}/chunk_{index:03d}.{CHUNK_EXTENSION}"
+        bucket.blob(blob_name).upload_from_filename(chunk_path, content_type=CHUNK_CONTENT_TYPE)
+        return f"gs://{GCS_BUCKET_NAME}/{blob_name}"
         
-        # Convert to FLAC format
-        audio = audio.set_frame_rate(16000).set_channels(1)
+    except Exception as e:
+        logger.error(f"Failed to upload audio chunk to GCS: {str(e)}")
+        raise
+
+def decode_to_pcm(audio_path: str, pcm_path: str) -> None:
+    """Stream-decode any input to raw 16 kHz mono 16-bit PCM on disk with ffmpeg"""
+    subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-i", audio_path,
+            "-ar", str(SAMPLE_RATE_HZ), "-ac", "1", "-f", "s16le", "-y", pcm_path
+        ],
+        capture_output=True, check=True
+    )
+
+def build_segment_command(pcm_path: str, cut_points: List[float], work_dir: str) -> List[str]:
+    """Build one ffmpeg command that splits the raw PCM file into chunk files at the cut points"""
+    command = [
+        "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error",
+        "-f", "s16le", "-ar", str(SAMPLE_RATE_HZ), "-ac", "1", "-i", pcm_path,
+        # FLAC chunks are thrown away after recognition, so they favour
+        # encode speed over size; LINEAR16 chunks are copied without encoding
+        *CHUNK_CODEC_OPTIONS,
+        "-f", "segment", "-reset_timestamps", "1",
+        # Each finished chunk's file name is written to stdout as it closes
+        "-segment_list", "pipe:1", "-segment_list_type", "flat"
+    ]
+    if cut_points:
+        command += ["-segment_times", ",".join(f"{cut:.3f}" for cut in cut_points)]
+    else:
+        # A single chunk: never split
+        command += ["-segment_time", "86400"]
+    command += ["-y", os.path.join(work_dir, f"chunk_%03d.{CHUNK_EXTENSION}")]
+    return command
+
+def prepare_audio_chunks(audio_path: str, work_dir: str) -> Tuple[str, List[float], float]:
+    """Decode audio to PCM in work_dir, plan the chunk cut points at silences and return its duration"""
+    try:
+        # Decode once to raw PCM on disk and map it, instead of holding the
+        # whole waveform (and its resampled copies) in Python memory. Where
+        # the temp dir is tmpfs (Cloud Run) the file still counts as RAM:
+        # about 115 MB per hour of audio, see WORKER_MAX_JOBS
+        pcm_path = os.path.join(work_dir, "audio.pcm")
+        decode_to_pcm(audio_path, pcm_path)
+        samples = np.memmap(pcm_path, dtype=np.int16, mode="r")
+        duration_s = len(samples) / SAMPLE_RATE_HZ
         
         # Split into chunks if longer than max duration
-        chunks = []
-        if len(audio) <= MAX_CHUNK_DURATION_MS:
+        if duration_s * 1000 <= MAX_CHUNK_DURATION_MS:
             # Audio is short enough, use as single chunk
-            buffer = io.BytesIO()
-            audio.export(buffer, format="flac")
-            chunks.append(buffer.getvalue())
+            cut_points = []
         else:
-            # Split on silence
-            audio_chunks = split_on_silence(
-                audio,
-                min_silence_len=1000,  # 1 second
-                silence_thresh=audio.dBFS - 14,
-                keep_silence=500  # 0.5 second
-            )
-            
-            # Group chunks to stay under max duration
-            current_chunk = AudioSegment.empty()
-            for chunk in audio_chunks:
-                if len(current_chunk) + len(chunk) <= MAX_CHUNK_DURATION_MS:
-                    current_chunk += chunk
-                else:
-                    if len(current_chunk) > 0:
-                        buffer = io.BytesIO()
-                        current_chunk.export(buffer, format="flac")
-                        chunks.append(buffer.getvalue())
-                    current_chunk = chunk
-            
-            # Add remaining chunk
-            if len(current_chunk) > 0:
-                buffer = io.BytesIO()
-                current_chunk.export(buffer, format="flac")
-                chunks.append(buffer.getvalue())
+            # Split on silence, detected on the samples in one vectorized pass
+            block_size = int(SAMPLE_RATE_HZ * SILENCE_SEEK_STEP_S)
+            energies = compute_block_energies(samples, block_size)
+            # Loudness comes from the same block energies, so the waveform is
+            # only scanned once; the partial tail block is not in them
+            dbfs = compute_dbfs(energies, len(energies) * block_size)
+            silences = detect_silences(energies, block_size, SAMPLE_RATE_HZ, dbfs - 14)
+            cut_points = plan_chunk_boundaries(silences, duration_s, MAX_CHUNK_DURATION_MS / 1000)
+        del samples
         
-        logger.info(f"Audio split into {len(chunks)} chunks")
-        return chunks
+        logger.info(f"Audio will be split into {len(cut_points) + 1} chunks")
+        return pcm_path, cut_points, duration_s
         
     except Exception as e:
         logger.error(f"Failed to process audio: {str(e)}")
         raise
 
-def transcribe_audio_chunk(audio_chunk: bytes, language: str) -> Dict[str, Any]:
-    """Transcribe a single audio chunk with speaker diarization"""
+def parse_recognition_results(results) -> Dict[str, Any]:
+    """Turn recognition results for one chunk into speaker-tagged word arrays"""
+    alternatives = [result.alternatives[0] for result in results if result.alternatives]
+    word_count = sum(len(alternative.words) for alternative in alternatives)
+    
+    # Words are stored as parallel arrays rather than one dict per word
+    words = []
+    start_times = np.empty(word_count, dtype=np.float32)
+    end_times = np.empty(word_count, dtype=np.float32)
+    speakers = np.empty(word_count, dtype=np.int16)
+    
+    i = 0
+    for alternative in alternatives:
+        for word_info in alternative.words:
+            words.append(word_info.word)
+            start_times[i] = word_info.start_offset.total_seconds()
+            end_times[i] = word_info.end_offset.total_seconds()
+            speakers[i] = int(word_info.speaker_label) if word_info.speaker_label else 0
+            i += 1
+    
+    return {
+        "words": words,
+        "start_times": start_times,
+        "end_times": end_times,
+        "speakers": speakers,
+        "speaker_count": int(speakers.max()) if word_count else 0,
+        "transcript": " ".join(words)
+    }
+
+# Model and features live on the persistent recognizer, requests only add
+# the language and how the chunks are encoded
+RECOGNIZER_CONFIG = cloud_speech.RecognitionConfig(
+    model="long",
+    features=cloud_speech.RecognitionFeatures(
+        enable_word_time_offsets=True,
+        enable_automatic_punctuation=True,
+        diarization_config=cloud_speech.SpeakerDiarizationConfig(
+            min_speaker_count=1,
+            max_speaker_count=10
+        )
+    )
+)
+
+def check_bucket_location() -> None:
+    """Warn when Speech runs in a different region than the audio bucket"""
     try:
-        # Configure recognition
-        config = speech.RecognitionConfig(
-            encoding=speech.RecognitionConfig.AudioEncoding.FLAC,
-            sample_rate_hertz=16000,
-            language_code=language,
-            enable_speaker_diarization=True,
-            diarization_speaker_count_min=1,
-            diarization_speaker_count_max=10,
-            enable_automatic_punctuation=True,
-            model="video"  # Use video model for better diarization
+        bucket_location = storage_client.get_bucket(GCS_BUCKET_NAME).location.lower()
+    except Exception as e:
+        logger.warning(f"Could not read location of bucket {GCS_BUCKET_NAME}: {str(e)}")
+        return
+    if bucket_location != SPEECH_LOCATION:
+        logger.warning(
+            f"Bucket {GCS_BUCKET_NAME} is in {bucket_location} but Speech runs in {SPEECH_LOCATION}, "
+            f"set SPEECH_LOCATION={bucket_location} to avoid cross-region reads"
         )
+
+@functools.lru_cache(maxsize=1)
+def get_recognizer() -> str:
+    """Return the persistent recognizer's name, creating it on first use"""
+    parent = f"projects/{GOOGLE_CLOUD_PROJECT}/locations/{SPEECH_LOCATION}"
+    name = f"{parent}/recognizers/{SPEECH_RECOGNIZER_ID}"
+    try:
+        speech_client.get_recognizer(name=name)
+    except NotFound:
+        logger.info(f"Creating Speech recognizer {name}")
+        try:
+            operation = speech_client.create_recognizer(
+                parent=parent,
+                recognizer=cloud_speech.Recognizer(default_recognition_config=RECOGNIZER_CONFIG),
+                recognizer_id=SPEECH_RECOGNIZER_ID
+            )
+            operation.result(timeout=300)
+        except AlreadyExists:
+            # Another worker created it first
+            pass
+    
+    check_bucket_location()
+    return name
+
+@functools.lru_cache(maxsize=32)
+def recognition_config(language: str) -> cloud_speech.RecognitionConfig:
+    """Build the per-request part of the recognition config for a language once"""
+    if CHUNK_ENCODING == "linear16":
+        # Headerless PCM has to be described explicitly
+        decoding = {"explicit_decoding_config": cloud_speech.ExplicitDecodingConfig(
+            encoding=cloud_speech.ExplicitDecodingConfig.AudioEncoding.LINEAR16,
+            sample_rate_hertz=SAMPLE_RATE_HZ,
+            audio_channel_count=1
+        )}
+    else:
+        decoding = {"auto_decoding_config": cloud_speech.AutoDetectDecodingConfig()}
+    
+    return cloud_speech.RecognitionConfig(
+        **decoding,
+        language_codes=[LANGUAGE_CODES.get(language, language)]
+    )
+
+def submit_batch_recognition(chunk_uris: List[str], language: str):
+    """Start a batch recognition with speaker diarization for chunks stored in GCS"""
+    try:
+        request = cloud_speech.BatchRecognizeRequest(
+            recognizer=get_recognizer(),
+            config=recognition_config(language),
+            files=[cloud_speech.BatchRecognizeFileMetadata(uri=uri) for uri in chunk_uris],
+            recognition_output_config=cloud_speech.RecognitionOutputConfig(
+                inline_response_config=cloud_speech.InlineOutputConfig()
+            )
+        )
+        return speech_client.batch_recognize(request=request)
         
-        audio = speech.RecognitionAudio(content=audio_chunk)
-        
-        # Perform transcription
-        operation = speech_client.long_running_recognize(config=config, audio=audio)
-        response = operation.result(timeout=900)  # 15 minutes timeout
-        
-        # Process results
-        segments = []
-        speaker_count = 0
-        
-        for result in response.results:
-            alternative = result.alternatives[0]
+    except Exception as e:
+        logger.error(f"Failed to submit batch recognition: {str(e)}")
+        raise
+
+def collect_recognition_results(operations, chunk_uris: List[str],
+                                on_progress: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+                                ) -> List[Dict[str, Any]]:
+    """Wait for batch recognitions and return per-chunk results in chunk order.
+    
+    If on_progress is given it is called with the leading chunks' results each
+    time a batch finishes before the last one, so callers can publish them early.
+    Results only arrive per batch operation, not per file; run_chunk_pipeline
+    keeps the first batches small so this starts after the first chunk.
+    """
+    try:
+        file_results = {}
+        chunk_results = []
+        for operation in operations:
+            response = operation.result(timeout=900)  # 15 minutes timeout
+            file_results.update(response.results)
             
-            # Extract speaker-tagged segments
-            for word_info in alternative.words:
-                speaker_tag = word_info.speaker_tag
-                if speaker_tag > speaker_count:
-                    speaker_count = speaker_tag
-                
-                segments.append({
-                    "word": word_info.word,
-                    "start_time": word_info.start_time.total_seconds(),
-                    "end_time": word_info.end_time.total_seconds(),
-                    "speaker": speaker_tag
-                })
+            # Parse every chunk whose predecessors have all been recognized
+            while len(chunk_results) < len(chunk_uris) and chunk_uris[len(chunk_results)] in file_results:
+                uri = chunk_uris[len(chunk_results)]
+                file_result = file_results[uri]
+                if file_result.error.code:
+                    raise RuntimeError(f"Recognition failed for {uri}: {file_result.error.message}")
+                chunk_results.append(parse_recognition_results(file_result.inline_result.transcript.results))
+            
+            if on_progress is not None and chunk_results and len(chunk_results) < len(chunk_uris):
+                # Publishing early is best-effort, it must not fail the transcription
+                try:
+                    on_progress(chunk_results)
+                except Exception as e:
+                    logger.warning(f"Failed to publish partial transcript: {str(e)}")
         
-        return {
-            "segments": segments,
-            "speaker_count": speaker_count,
-            "transcript": " ".join([seg["word"] for seg in segments])
-        }
+        return chunk_results
         
     except Exception as e:
-        logger.error(f"Failed to transcribe audio chunk: {str(e)}")
+        logger.error(f"Failed to transcribe audio chunks: {str(e)}")
         raise
 
-def merge_transcript_chunks(chunks_results: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Merge transcription results from multiple chunks"""
+async def run_chunk_pipeline(pcm_path: str, cut_points: List[float],
+                             work_dir: str, language: str) -> Tuple[list, List[str]]:
+    """Encode, upload and submit recognition for chunks as overlapping stages.
+    
+    A single ffmpeg segmenter encodes every chunk and reports each one as it
+    finishes, so chunk K uploads while chunk K+1 encodes, and each batch of
+    uploaded chunks is submitted for recognition while later chunks are still
+    being prepared. Returns the recognition operations and the chunk URIs in
+    chunk order.
+    """
+    session_id = str(uuid.uuid4())
+    upload_queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    recognize_queue = asyncio.Queue()
+    chunk_uris = {}
+    operations = []
+    
+    async def encoder():
+        process = await asyncio.create_subprocess_exec(
+            *build_segment_command(pcm_path, cut_points, work_dir),
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stderr = asyncio.create_task(process.stderr.read())
+        try:
+            i = 0
+            async for line in process.stdout:
+                chunk_path = os.path.join(work_dir, line.decode().strip())
+                await upload_queue.put((i, chunk_path))
+                i += 1
+            if await process.wait() != 0:
+                raise RuntimeError(f"ffmpeg segmenting failed: {(await stderr).decode().strip()}")
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+        for _ in range(MAX_CONCURRENT_CHUNK_UPLOADS):
+            await upload_queue.put(None)
+    
+    async def uploader():
+        while (item := await upload_queue.get()) is not None:
+            i, chunk_path = item
+            chunk_uri = await asyncio.to_thread(upload_chunk_to_gcs, chunk_path, session_id, i)
+            os.unlink(chunk_path)
+            await recognize_queue.put((i, chunk_uri))
+    
+    async def upload_stage():
+        await asyncio.gather(*(uploader() for _ in range(MAX_CONCURRENT_CHUNK_UPLOADS)))
+        await recognize_queue.put(None)
+    
+    async def recognizer():
+        pending = []
+        # Batches start at one chunk and double up to the limit, so the first
+        # chunks' text comes back (and is published) within minutes instead
+        # of after a full batch, at the cost of a few extra operations
+        batch_size = 1
+        while (item := await recognize_queue.get()) is not None:
+            i, chunk_uri = item
+            chunk_uris[i] = chunk_uri
+            pending.append(chunk_uri)
+            if len(pending) == batch_size:
+                operations.append(await asyncio.to_thread(submit_batch_recognition, pending, language))
+                pending = []
+                batch_size = min(batch_size * 2, MAX_FILES_PER_BATCH)
+        if pending:
+            operations.append(await asyncio.to_thread(submit_batch_recognition, pending, language))
+    
+    tasks = [asyncio.create_task(stage()) for stage in (encoder, upload_stage, recognizer)]
     try:
-        all_segments = []
-        total_duration = 0
-        max_speaker_count = 0
-        
-        for chunk_result in chunks_results:
-            # Adjust timing offsets for each chunk
-            for segment in chunk_result["segments"]:
-                segment["start_time"] += total_duration
-                segment["end_time"] += total_duration
-                all_segments.append(segment)
-            
-            if chunk_result["segments"]:
-                total_duration = max(seg["end_time"] for seg in chunk_result["segments"])
-            
-            max_speaker_count = max(max_speaker_count, chunk_result["speaker_count"])
+        await asyncio.gather(*tasks)
+    except Exception:
+        # A failed stage would leave the others waiting on their queues.
+        # Wait for them to unwind (and ffmpeg to be reaped) before the
+        # caller removes the work directory.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    
+    return operations, [chunk_uris[i] for i in sorted(chunk_uris)]
+
+def merge_transcript_chunks(chunks_results: List[Dict[str, Any]], duration_s: float) -> Dict[str, Any]:
+    """Merge transcription results from multiple chunks of audio lasting duration_s"""
+    try:
+        max_speaker_count = max((r["speaker_count"] for r in chunks_results), default=0)
         
-        # Group segments by speaker and time
-        transcript_text = ""
-        current_speaker = None
+        words = [word for r in chunks_results for word in r["words"]]
+        speakers = np.concatenate([r["speakers"] for r in chunks_results]) if chunks_results else np.empty(0, dtype=np.int16)
         
-        for segment in sorted(all_segments, key=lambda x: x["start_time"]):
-            if segment["speaker"] != current_speaker:
-                if current_speaker is not None:
-                    transcript_text += "\n"
-                transcript_text += f"Speaker {segment['speaker']}: "
-                current_speaker = segment["speaker"]
-            transcript_text += segment["word"] + " "
+        # Group words into speaker turns at every change of speaker
+        bounds = [0, *(np.flatnonzero(np.diff(speakers)) + 1).tolist(), len(words)] if words else [0]
+        turns = [
+            f"Speaker {speakers[start]}: " + " ".join(words[start:end])
+            for start, end in zip(bounds, bounds[1:])
+        ]
         
         return {
-            "transcript_text": transcript_text.strip(),
+            "transcript_text": " \n".join(turns),
             "speaker_count": max_speaker_count,
-            "duration_seconds": int(total_duration)
+            # The decoded length, not the last word, since usage is billed on it
+            "duration_seconds": int(duration_s)
         }
         
     except Exception as e:
         logger.error(f"Failed to merge transcript chunks: {str(e)}")
         raise
 
-async def transcribe_audio_file(audio_file, language: str, original_filename: str) -> Dict[str, Any]:
-    """Main function to transcribe an audio file"""
+async def transcribe_audio_file(audio_path: str, language: str, original_filename: str,
+                                on_partial_transcript: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """Main function to transcribe a local audio file.
+    
+    on_partial_transcript, if given, receives the transcript text recognized
+    so far whenever a batch of chunks finishes ahead of the rest.
+    """
     try:
         logger.info(f"Starting transcription for file: {original_filename}")
         
-        # Upload to GCS
-        gcs_uri = upload_audio_to_gcs(audio_file, original_filename)
-        
-        # Convert and split audio
-        audio_chunks = convert_and_split_audio(audio_file)
+        with tempfile.TemporaryDirectory() as work_dir:
+            # Decode audio and plan the chunks
+            pcm_path, cut_points, duration_s = await asyncio.to_thread(prepare_audio_chunks, audio_path, work_dir)
+            
+            # Encode, upload and submit recognition as a pipeline
+            operations, chunk_uris = await run_chunk_pipeline(pcm_path, cut_points, work_dir, language)
         
-        # Transcribe each chunk
-        chunk_results = []
-        for i, chunk in enumerate(audio_chunks):
-            logger.info(f"Transcribing chunk {i+1}/{len(audio_chunks)}")
-            result = transcribe_audio_chunk(chunk, language)
-            chunk_results.append(result)
+        # Wait for the transcriptions
+        logger.info(f"Waiting for transcription of {len(chunk_uris)} chunks")
+        on_progress = None
+        if on_partial_transcript is not None:
+            on_progress = lambda results: on_partial_transcript(merge_transcript_chunks(results, duration_s)["transcript_text"])
+        chunk_results = await asyncio.to_thread(collect_recognition_results, operations, chunk_uris, on_progress)
         
         # Merge results
-        final_result = merge_transcript_chunks(chunk_results)
-        final_result["gcs_uri"] = gcs_uri
+        final_result = merge_transcript_chunks(chunk_results, duration_s)
         
         logger.info(f"Transcription completed for {original_filename}")
         return final_result
@@ -0,0 +1,109 @@
+# worker.py
+import asyncio
+import logging
+import os
+import tempfile
+from arq.connections import RedisSettings
+
+# Local imports
+from config import settings
+from database import SessionLocal, update_transcript_status, update_usage
+from transcriber import transcribe_audio_file, download_audio_from_gcs
+from summarizer import generate_summary_and_action_items
+
+# Setup logging
+logging.basicConfig(level=logging.INFO,
+                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def save_partial_transcript(transcript_id: str, transcript_text: str):
+    """Store a partial transcript. Runs on a worker thread, so it uses its own session."""
+    with SessionLocal() as db_session:
+        update_transcript_status(db_session, transcript_id, "processing", transcript_text=transcript_text)
+
+async def process_audio(
+    ctx,
+    transcript_id: str,
+    user_id: str,
+    gcs_uri: str,
+    original_filename: str,
+    language: str
+):
+    """Queue job that transcribes and summarizes an uploaded audio file"""
+    suffix = os.path.splitext(original_filename or "")[1]
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        audio_path = tmp.name
+    
+    with SessionLocal() as db_session:
+        try:
+            logger.info(f"Starting processing for transcript {transcript_id}")
+            
+            # Update status to processing
+            update_transcript_status(db_session, transcript_id, "processing")
+            
+            # Fetch the audio the API stored in GCS
+            await asyncio.to_thread(download_audio_from_gcs, gcs_uri, audio_path)
+            
+            # Transcribe audio, saving the text of finished chunks as it arrives
+            # so a partial transcript shows while the rest is still processing
+            result = await transcribe_audio_file(
+                audio_path, language, original_filename,
+                on_partial_transcript=lambda text: save_partial_transcript(transcript_id, text)
+            )
+            
+            # Generate summary
+            summary_result = await generate_summary_and_action_items(
+                result["transcript_text"], language
+            )
+            
+            # Update transcript with results
+            update_transcript_status(
+                db_session,
+                transcript_id,
+                "done",
+                transcript_text=result["transcript_text"],
+                summary_text=summary_result["summary_text"],
+                duration_seconds=result["duration_seconds"],
+                speaker_count=result["speaker_count"]
+            )
+            
+            # Update usage statistics
+            update_usage(db_session, user_id, result["duration_seconds"])
+            
+            logger.info(f"Successfully processed transcript {transcript_id}")
+            
+        except asyncio.CancelledError:
+            # arq cancels the job when it exceeds job_timeout
+            logger.error(f"Processing timed out for transcript {transcript_id}")
+            db_session.rollback()
+            update_transcript_status(db_session, transcript_id, "error", transcript_text=None)
+            raise
+        except Exception as e:
+            logger.error(f"Processing failed for transcript {transcript_id}: {str(e)}")
+            # Update status to error, dropping any partial transcript
+            db_session.rollback()
+            update_transcript_status(db_session, transcript_id, "error", transcript_text=None)
+        finally:
+            os.unlink(audio_path)
+
+async def _close_connection(reader, writer):
+    """Accepting the connection is all the health check needs"""
+    writer.close()
+
+async def startup(ctx):
+    """Listen on PORT so Cloud Run's TCP startup probe sees the worker as up"""
+    ctx["health_server"] = await asyncio.start_server(_close_connection, port=settings.PORT)
+
+async def shutdown(ctx):
+    """Stop the health check listener"""
+    ctx["health_server"].close()
+    await ctx["health_server"].wait_closed()
+
+class WorkerSettings:
+    """arq worker configuration, run with: arq worker.WorkerSettings"""
+    functions = [process_audio]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL)
+    max_jobs = settings.WORKER_MAX_JOBS
+    job_timeout = 60 * 60  # 1 hour, long meetings take a while